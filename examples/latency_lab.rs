@@ -164,7 +164,9 @@ async fn run_timed(
     reps: usize,
 ) -> eyre::Result<(f64, f64, f64, String)> {
     use std::time::Instant;
-    let mut times = Vec::with_capacity(reps);
+    // Only mean/min/max are reported, so fold them as the reps run instead of
+    // collecting + sorting the timings afterwards.
+    let (mut sum, mut min, mut max) = (0.0_f64, f64::INFINITY, 0.0_f64);
     let mut last = String::new();
     for _ in 0..reps {
         let t = Instant::now();
@@ -173,9 +175,10 @@ async fn run_timed(
         } else {
             engine.eval_cleanup(prompt, raw, false).await?
         };
-        times.push(t.elapsed().as_secs_f64() * 1000.0);
+        let ms = t.elapsed().as_secs_f64() * 1000.0;
+        sum += ms;
+        min = min.min(ms);
+        max = max.max(ms);
     }
-    times.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let mean = times.iter().sum::<f64>() / times.len() as f64;
-    Ok((mean, times[0], times[times.len() - 1], last))
+    Ok((sum / reps.max(1) as f64, min, max, last))
 }
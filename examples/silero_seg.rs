@@ -11,7 +11,11 @@
 //! in vad_stream_lab already answers the segmentation question well enough, and
 //! its only weakness (mild over-segmentation) was addressed there directly.
 //! To revive: cross-check against the `voice_activity_detector` crate's exact
-//! call sequence, or pin a known-good model export.
+//! call sequence, or pin a known-good model export. The loop below now also
+//! carries the 64-sample context the upstream v5 wrapper prepends to every
+//! window (the last samples of the previous window, input `[1, 576]`) along
+//! with the LSTM state; the export may expect it, but that's unconfirmed
+//! against the test corpus.
 //!
 //! ```bash
 //! ./scripts/gen-vad-corpus.sh
@@ -28,17 +32,25 @@ fn main() {
 #[cfg(feature = "parakeet")]
 fn main() -> eyre::Result<()> {
     use fast_dictate_backend::transcriber::load_wav_mono16k;
+    use ort::session::builder::GraphOptimizationLevel;
     use ort::session::Session;
-    use ort::value::Tensor;
+    use ort::value::TensorRef;
 
     const SR: i64 = 16_000;
     const WIN: usize = 512; // Silero v5 window @ 16 kHz = 32 ms
+    const CTX: usize = 64; // trailing samples of the previous window, fed first
 
     let model = "testdata/vad-model/silero_vad.onnx";
     if !std::path::Path::new(model).exists() {
         eyre::bail!("missing {model} — download silero_vad.onnx first");
     }
-    let mut sess = Session::builder()?.commit_from_file(model)?;
+    // A 512-sample window is ~0.5 ms of compute, so per-run overhead dominates:
+    // fuse the graph fully at load and keep each run on one thread instead of
+    // waking an intra-op pool for a tiny LSTM.
+    let mut sess = Session::builder()?
+        .with_optimization_level(GraphOptimizationLevel::Level3)?
+        .with_intra_threads(1)?
+        .commit_from_file(model)?;
 
     let dir = std::path::Path::new("testdata/vad");
     let mut clips: Vec<(String, usize)> = Vec::new(); // (wav, true sentence count)
@@ -60,19 +72,24 @@ fn main() -> eyre::Result<()> {
         let audio = load_wav_mono16k(wav)?;
 
         // ---- Silero: per-window speech probability with carried state ----
+        // Streaming state across windows: the LSTM state and the context
+        // samples (`buf[..CTX]`, the tail of the previous window). Both start
+        // zeroed per clip, like the upstream wrapper's reset.
         let mut state = vec![0.0f32; 2 * 128]; // [2,1,128]
         let mut probs: Vec<f32> = Vec::new();
-        let mut buf = [0.0f32; WIN];
+        let mut buf = [0.0f32; CTX + WIN];
         let mut i = 0;
         while i < audio.len() {
             let n = (audio.len() - i).min(WIN);
-            buf[..n].copy_from_slice(&audio[i..i + n]);
+            buf[CTX..CTX + n].copy_from_slice(&audio[i..i + n]);
             if n < WIN {
-                buf[n..].fill(0.0);
+                buf[CTX + n..].fill(0.0);
             }
-            let input = Tensor::from_array(([1_i64, WIN as i64], buf.to_vec()))?;
-            let state_t = Tensor::from_array(([2_i64, 1, 128], state.clone()))?;
-            let sr_t = Tensor::from_array((vec![] as Vec<i64>, vec![SR]))?;
+            // Borrow the window, state and rate in place rather than copying each
+            // into a fresh owned tensor per 32 ms window.
+            let input = TensorRef::from_array_view(([1_i64, (CTX + WIN) as i64], &buf[..]))?;
+            let state_t = TensorRef::from_array_view(([2_i64, 1, 128], &state[..]))?;
+            let sr_t = TensorRef::from_array_view(([0_i64; 0], std::slice::from_ref(&SR)))?;
             let outputs = sess.run(ort::inputs![
                 "input" => input,
                 "state" => state_t,
@@ -82,6 +99,7 @@ fn main() -> eyre::Result<()> {
             probs.push(prob[0]);
             let (_, new_state) = outputs["stateN"].try_extract_tensor::<f32>()?;
             state.copy_from_slice(new_state);
+            buf.copy_within(WIN.., 0);
             i += WIN;
         }
 
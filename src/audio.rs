@@ -118,13 +118,16 @@ impl AudioCaptureEngine {
         // Carry: fractional sample position across callback boundaries.
         let mut pos: f64 = 0.0;
         let mut last: f32 = 0.0;
+        // Downmix scratch, owned by the callback and reused every invocation so
+        // the realtime thread stops allocating once it has seen one buffer.
+        let mut mono: Vec<f32> = Vec::new();
         let err_fn = |e| eprintln!("[audio] cpal stream error: {e}");
 
         let stream = match sample_format {
             SampleFormat::F32 => device.build_input_stream(
                 &config,
                 move |data: &[f32], _| {
-                    push_resampled(data, channels, stride, &mut pos, &mut last, &mut producer);
+                    push_resampled(data, |s| s, channels, stride, &mut pos, &mut last, &mut mono, &mut producer);
                 },
                 err_fn,
                 None,
@@ -132,8 +135,8 @@ impl AudioCaptureEngine {
             SampleFormat::I16 => device.build_input_stream(
                 &config,
                 move |data: &[i16], _| {
-                    let f: Vec<f32> = data.iter().map(|s| *s as f32 / 32_768.0).collect();
-                    push_resampled(&f, channels, stride, &mut pos, &mut last, &mut producer);
+                    let to_f32 = |s: i16| s as f32 / 32_768.0;
+                    push_resampled(data, to_f32, channels, stride, &mut pos, &mut last, &mut mono, &mut producer);
                 },
                 err_fn,
                 None,
@@ -141,11 +144,8 @@ impl AudioCaptureEngine {
             SampleFormat::U16 => device.build_input_stream(
                 &config,
                 move |data: &[u16], _| {
-                    let f: Vec<f32> = data
-                        .iter()
-                        .map(|s| (*s as f32 - 32_768.0) / 32_768.0)
-                        .collect();
-                    push_resampled(&f, channels, stride, &mut pos, &mut last, &mut producer);
+                    let to_f32 = |s: u16| (s as f32 - 32_768.0) / 32_768.0;
+                    push_resampled(data, to_f32, channels, stride, &mut pos, &mut last, &mut mono, &mut producer);
                 },
                 err_fn,
                 None,
@@ -172,31 +172,23 @@ impl AudioCaptureEngine {
 
 /// Downmix interleaved native samples to mono, then linearly resample at
 /// `stride = native_rate / 16000` and push to the SPSC ring buffer. `pos` and
-/// `last` carry fractional resample state across cpal callback invocations.
-fn push_resampled(
-    interleaved: &[f32],
+/// `last` carry fractional resample state across cpal callback invocations;
+/// `mono` is the caller's reusable downmix scratch.
+#[allow(clippy::too_many_arguments)]
+fn push_resampled<T: Copy>(
+    interleaved: &[T],
+    to_f32: impl Fn(T) -> f32,
     channels: usize,
     stride: f64,
     pos: &mut f64,
     last: &mut f32,
+    mono: &mut Vec<f32>,
     producer: &mut HeapAudioProducer,
 ) {
-    let frames = interleaved.len() / channels.max(1);
-    if frames == 0 {
+    if !downmix_into(interleaved, to_f32, channels, mono) {
         return;
     }
 
-    // Reusable mono buffer.
-    let mut mono = Vec::with_capacity(frames);
-    if channels <= 1 {
-        mono.extend_from_slice(interleaved);
-    } else {
-        for frame in interleaved.chunks_exact(channels) {
-            let sum: f32 = frame.iter().sum();
-            mono.push(sum / channels as f32);
-        }
-    }
-
     // Push RMS of this chunk to the waveform ring for the UI pill. Computed
     // pre-resample on native mono so it reflects real microphone activity.
     let sum_sq: f32 = mono.iter().map(|x| x * x).sum();
@@ -240,6 +232,9 @@ mod tests {
         r.push(&[4.0, 5.0]);
         assert_eq!(r.snapshot(), vec![2.0, 3.0, 4.0, 5.0]);
         assert_eq!(r.len(), 4);
+        // The two halves read in order are the same lookback.
+        let (head, tail) = r.as_slices();
+        assert_eq!([head, tail].concat(), r.snapshot());
     }
 
     #[test]
@@ -258,6 +253,21 @@ mod tests {
         assert_eq!(r.snapshot(), Vec::<f32>::new());
     }
 
+    #[test]
+    fn drain_into_moves_wrapped_ring_contents_in_order() {
+        let (mut prod, mut cons) = HeapRb::<f32>::new(4).split();
+        let mut out = vec![9.0];
+        // Fill, consume part, refill so the queued samples wrap around the end
+        // of the ring's storage (two slices).
+        prod.push_slice(&[1.0, 2.0, 3.0]);
+        assert_eq!(drain_into(&mut cons, &mut out), 3);
+        prod.push_slice(&[4.0, 5.0, 6.0]);
+        assert_eq!(drain_into(&mut cons, &mut out), 3);
+        assert_eq!(out, vec![9.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]);
+        assert!(cons.is_empty());
+        assert_eq!(drain_into(&mut cons, &mut out), 0);
+    }
+
     #[test]
     fn bluetooth_device_detection() {
         assert!(is_bluetooth_device("Tristan's AirPods Pro"));
@@ -275,7 +285,8 @@ mod tests {
         // the `last` carry of 0.0).
         let mut pos = 0.0;
         let mut last = 0.0;
-        let out = resample_to_vec(&[0.5, 0.5, 0.5, 0.5], 1, 1.0, &mut pos, &mut last);
+        let (mut mono, mut out) = (Vec::new(), Vec::new());
+        resample_into(&[0.5, 0.5, 0.5, 0.5], |s: f32| s, 1, 1.0, &mut pos, &mut last, &mut mono, &mut out);
         assert_eq!(out.len(), 4);
         assert_eq!(*out.last().unwrap(), 0.5);
     }
@@ -321,10 +332,11 @@ impl PrerollRing {
         } else {
             samples
         };
+        // Evict first so the deque never grows past `cap` and never
+        // reallocates: it stays the fixed circular buffer allocated in `new`.
+        let excess = (self.buf.len() + tail.len()).saturating_sub(self.cap);
+        self.buf.drain(..excess);
         self.buf.extend(tail.iter().copied());
-        while self.buf.len() > self.cap {
-            self.buf.pop_front();
-        }
     }
 
     /// Copy the retained lookback into a contiguous buffer (oldest → newest).
@@ -332,6 +344,12 @@ impl PrerollRing {
         self.buf.iter().copied().collect()
     }
 
+    /// The retained lookback as the ring's two contiguous halves (oldest →
+    /// newest when read in order), for copying out without a snapshot `Vec`.
+    pub fn as_slices(&self) -> (&[f32], &[f32]) {
+        self.buf.as_slices()
+    }
+
     pub fn len(&self) -> usize {
         self.buf.len()
     }
@@ -458,6 +476,10 @@ impl AlwaysOnCapture {
         let mut last: f32 = 0.0;
         let mut preroll = PrerollRing::new(self.preroll_samples);
         let mut prev_recording = false;
+        // Per-callback scratch (downmix, resampled chunk), reused across
+        // invocations so steady-state callbacks don't allocate.
+        let mut mono: Vec<f32> = Vec::new();
+        let mut chunk: Vec<f32> = Vec::new();
         let recording = self.recording.clone();
         let err_fn = |e| eprintln!("[audio] cpal stream error: {e}");
 
@@ -465,23 +487,21 @@ impl AlwaysOnCapture {
         macro_rules! make_cb {
             ($t:ty, $to_f32:expr) => {
                 move |data: &[$t], _: &_| {
-                    let f: Vec<f32> = data.iter().map($to_f32).collect();
-                    let chunk = resample_to_vec(&f, channels, stride, &mut pos, &mut last);
+                    resample_into(data, $to_f32, channels, stride, &mut pos, &mut last, &mut mono, &mut chunk);
                     if chunk.is_empty() {
                         return;
                     }
                     let rec = recording.load(Ordering::SeqCst);
-                    // Rising edge: flush the lookback captured *before* the press.
+                    // Rising edge: flush the lookback captured *before* the press,
+                    // straight from the ring's storage.
                     if rec && !prev_recording {
-                        for s in preroll.snapshot() {
-                            let _ = producer.try_push(s);
-                        }
+                        let (head, tail) = preroll.as_slices();
+                        producer.push_slice(head);
+                        producer.push_slice(tail);
                     }
                     preroll.push(&chunk);
                     if rec {
-                        for &s in &chunk {
-                            let _ = producer.try_push(s);
-                        }
+                        producer.push_slice(&chunk);
                     }
                     prev_recording = rec;
                 }
@@ -491,19 +511,19 @@ impl AlwaysOnCapture {
         let stream = match sample_format {
             SampleFormat::F32 => device.build_input_stream(
                 &config,
-                make_cb!(f32, |s: &f32| *s),
+                make_cb!(f32, |s: f32| s),
                 err_fn,
                 None,
             ),
             SampleFormat::I16 => device.build_input_stream(
                 &config,
-                make_cb!(i16, |s: &i16| *s as f32 / 32_768.0),
+                make_cb!(i16, |s: i16| s as f32 / 32_768.0),
                 err_fn,
                 None,
             ),
             SampleFormat::U16 => device.build_input_stream(
                 &config,
-                make_cb!(u16, |s: &u16| (*s as f32 - 32_768.0) / 32_768.0),
+                make_cb!(u16, |s: u16| (s as f32 - 32_768.0) / 32_768.0),
                 err_fn,
                 None,
             ),
@@ -557,35 +577,59 @@ fn is_bluetooth_device(name: &str) -> bool {
         || n.contains("headphones")
 }
 
-/// Like [`push_resampled`] but returns the resampled mono 16 kHz chunk instead
-/// of pushing it into a producer, so the always-on callback can route it to
-/// both the pre-roll ring and (when recording) the consumer. Also feeds the
-/// waveform level ring, matching the PTT path.
-fn resample_to_vec(
-    interleaved: &[f32],
+/// Replace `mono` with the mono downmix of `interleaved`, reusing its
+/// allocation. Integer formats are converted with `to_f32` inside the same
+/// pass, so there is no intermediate interleaved f32 copy. Returns false
+/// (leaving `mono` empty) when there isn't a whole frame to mix.
+fn downmix_into<T: Copy>(
+    interleaved: &[T],
+    to_f32: impl Fn(T) -> f32,
     channels: usize,
-    stride: f64,
-    pos: &mut f64,
-    last: &mut f32,
-) -> Vec<f32> {
-    let frames = interleaved.len() / channels.max(1);
-    if frames == 0 {
-        return Vec::new();
+    mono: &mut Vec<f32>,
+) -> bool {
+    mono.clear();
+    if interleaved.len() < channels.max(1) {
+        return false;
     }
-    let mut mono = Vec::with_capacity(frames);
     if channels <= 1 {
-        mono.extend_from_slice(interleaved);
+        mono.extend(interleaved.iter().map(|&s| to_f32(s)));
     } else {
-        for frame in interleaved.chunks_exact(channels) {
-            let sum: f32 = frame.iter().sum();
-            mono.push(sum / channels as f32);
-        }
+        mono.extend(
+            interleaved
+                .chunks_exact(channels)
+                .map(|frame| frame.iter().map(|&s| to_f32(s)).sum::<f32>() / channels as f32),
+        );
+    }
+    true
+}
+
+/// Like [`push_resampled`] but writes the resampled mono 16 kHz chunk into
+/// `out` instead of pushing it into a producer, so the always-on callback can
+/// route it to both the pre-roll ring and (when recording) the consumer. Also
+/// feeds the waveform level ring, matching the PTT path. `mono` and `out` are
+/// the callback's scratch buffers: both are cleared and refilled, so steady-
+/// state callbacks reuse their capacity instead of allocating on the realtime
+/// audio thread.
+#[allow(clippy::too_many_arguments)]
+fn resample_into<T: Copy>(
+    interleaved: &[T],
+    to_f32: impl Fn(T) -> f32,
+    channels: usize,
+    stride: f64,
+    pos: &mut f64,
+    last: &mut f32,
+    mono: &mut Vec<f32>,
+    out: &mut Vec<f32>,
+) {
+    out.clear();
+    if !downmix_into(interleaved, to_f32, channels, mono) {
+        return;
     }
     let sum_sq: f32 = mono.iter().map(|x| x * x).sum();
     let rms = (sum_sq / mono.len() as f32).sqrt();
     crate::ui_channel::push_level(rms);
 
-    let mut out = Vec::with_capacity((mono.len() as f64 / stride).ceil() as usize + 1);
+    out.reserve((mono.len() as f64 / stride).ceil() as usize + 1);
     while *pos < mono.len() as f64 {
         let idx = pos.floor() as usize;
         let frac = (*pos - idx as f64) as f32;
@@ -596,7 +640,23 @@ fn resample_to_vec(
     }
     *pos -= mono.len() as f64;
     *last = *mono.last().unwrap();
-    out
+}
+
+/// Append everything currently queued in `consumer` to `out`, returning how
+/// many samples moved. Copies straight out of the ring's storage (its two
+/// contiguous halves) into `out`, then releases them — no per-drain scratch
+/// `Vec` to allocate, zero-fill, and copy a second time.
+pub fn drain_into(consumer: &mut HeapAudioConsumer, out: &mut Vec<f32>) -> usize {
+    let (head, tail) = consumer.as_slices();
+    let n = head.len() + tail.len();
+    if n == 0 {
+        return 0;
+    }
+    out.reserve(n);
+    out.extend_from_slice(head);
+    out.extend_from_slice(tail);
+    consumer.skip(n);
+    n
 }
 
 /// Drain a *borrowed* SPSC consumer until `is_recording` is false and the queue
@@ -607,12 +667,7 @@ fn resample_to_vec(
 pub fn drain_session(consumer: &mut HeapAudioConsumer, is_recording: &AtomicBool) -> Vec<f32> {
     let mut audio_buffer: Vec<f32> = Vec::with_capacity(SAMPLE_RATE as usize * 5);
     while is_recording.load(Ordering::SeqCst) || !consumer.is_empty() {
-        let pending = consumer.occupied_len();
-        if pending > 0 {
-            let mut chunk = vec![0.0_f32; pending];
-            let got = consumer.pop_slice(&mut chunk);
-            audio_buffer.extend_from_slice(&chunk[..got]);
-        } else {
+        if drain_into(consumer, &mut audio_buffer) == 0 {
             std::thread::sleep(std::time::Duration::from_millis(15));
         }
     }
@@ -633,12 +688,7 @@ pub async fn drain_until_stopped(
 ) -> Vec<f32> {
     let mut audio_buffer: Vec<f32> = Vec::with_capacity(SAMPLE_RATE as usize * 5);
     while is_recording.load(Ordering::SeqCst) || !consumer.is_empty() {
-        let pending = consumer.occupied_len();
-        if pending > 0 {
-            let mut chunk = vec![0.0_f32; pending];
-            let got = consumer.pop_slice(&mut chunk);
-            audio_buffer.extend_from_slice(&chunk[..got]);
-        } else {
+        if drain_into(&mut consumer, &mut audio_buffer) == 0 {
             tokio::time::sleep(tokio::time::Duration::from_millis(15)).await;
         }
     }
@@ -73,7 +73,7 @@ pub fn mute() {
     // If we can't read the device's current state, leave it untouched rather
     // than mute-then-restore — a failed read previously defaulted to "unmuted",
     // which on restore would un-mute audio the user had muted themselves.
-    let was_muted = match current_muted() {
+    let was_muted = match mute_reporting_prior() {
         Some(m) => m,
         None => {
             // Release the ownership we just claimed so a later restore() is a
@@ -83,9 +83,6 @@ pub fn mute() {
         }
     };
     WAS_MUTED.store(was_muted, Ordering::SeqCst);
-    if should_change(was_muted) {
-        set_muted(true);
-    }
 }
 
 /// Restore output to its pre-capture state. No-op if we never muted (not
@@ -116,12 +113,24 @@ impl Drop for RestoreOnDrop {
     }
 }
 
-/// Read the current system output mute flag via AppleScript. Returns `None` if
-/// `osascript` is unavailable or the output couldn't be parsed.
+/// Read-then-mute in one AppleScript: reads the output mute flag, mutes only
+/// if it was unmuted, and returns the prior state. One `osascript` spawn (and
+/// one script compile) per press instead of a read followed by a separate set.
+/// If the read fails the script errors before touching the device, so `None`
+/// still means "left untouched".
+#[cfg(target_os = "macos")]
+const MUTE_REPORTING_PRIOR_SCRIPT: &str = "\
+set wasMuted to output muted of (get volume settings)
+if not wasMuted then set volume output muted true
+return wasMuted";
+
+/// Mute system output if it isn't already, returning whether it was muted
+/// before. `None` if `osascript` is unavailable or the prior state couldn't be
+/// read/parsed (the device is then left as it was).
 #[cfg(target_os = "macos")]
-fn current_muted() -> Option<bool> {
+fn mute_reporting_prior() -> Option<bool> {
     let out = Command::new("osascript")
-        .args(["-e", "output muted of (get volume settings)"])
+        .args(["-e", MUTE_REPORTING_PRIOR_SCRIPT])
         .output()
         .ok()?;
     if !out.status.success() {
@@ -136,7 +145,7 @@ fn current_muted() -> Option<bool> {
 }
 
 #[cfg(not(target_os = "macos"))]
-fn current_muted() -> Option<bool> {
+fn mute_reporting_prior() -> Option<bool> {
     None
 }
 
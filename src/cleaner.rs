@@ -29,6 +29,7 @@ use llama_cpp_2::{
 };
 use crate::prompts::Prompts;
 use std::{
+    borrow::Cow,
     num::NonZeroU32,
     path::Path,
     sync::{Arc, OnceLock},
@@ -59,6 +60,11 @@ fn backend() -> eyre::Result<Arc<LlamaBackend>> {
 /// memory is paid once rather than per utterance.
 const MAX_CTX: u32 = 8192;
 
+/// How much of the already-cleaned text (in chars, from the end) a streamed
+/// segment sees as left-context. Enough for casing/flow continuity across a
+/// sentence boundary; callers only need to supply this much.
+pub const PRIOR_CONTEXT_CHARS: usize = 240;
+
 /// A unit of work for the cleanup worker thread: a fully-templated prompt plus
 /// the generation parameters and a channel to return the polished result on.
 struct Job {
@@ -116,6 +122,11 @@ pub struct TextCleanupEngine {
     /// corrections.json). Combined with any per-utterance screen-harvested
     /// terms into the vocabulary block appended to each cleanup prompt.
     static_vocab: Vec<String>,
+    /// `cleanup_prompt` + the vocabulary block for `static_vocab` alone, built
+    /// once at init. Most utterances (every streamed segment, and any dictation
+    /// with no screen terms) use exactly this body, so they skip re-merging and
+    /// re-deduping the curated vocabulary per call.
+    static_prompt_body: String,
     /// True when an output-format preset (numbered / bullets / email / …) is
     /// active. List-style presets need their line breaks preserved, so the
     /// cleanup path keeps newlines instead of flattening to one line as plain
@@ -195,6 +206,10 @@ impl TextCleanupEngine {
             );
         }
         let cleanup_prompt = base_cleanup;
+        let mut static_prompt_body = cleanup_prompt.clone();
+        if let Some(suffix) = crate::prompts::vocabulary_suffix(&static_vocab) {
+            static_prompt_body.push_str(&suffix);
+        }
 
         // Spawn the worker that owns the persistent context. Warm it with the
         // cleanup *instructions* + framing (no vocabulary, empty transcript) so
@@ -230,6 +245,7 @@ impl TextCleanupEngine {
             prompts,
             cleanup_prompt,
             static_vocab,
+            static_prompt_body,
             format_active,
             job_tx: Some(job_tx),
             worker: Some(worker),
@@ -273,19 +289,7 @@ impl TextCleanupEngine {
         if raw.is_empty() {
             return Ok(String::new());
         }
-        let mut prompt_body = self.cleanup_prompt.clone();
-        // Curated corrections first (high-trust), then screen-harvested terms.
-        // `vocabulary_suffix` dedups case-insensitively (first-seen casing wins)
-        // and caps the total, so a noisy screen can't balloon the prompt.
-        if !self.static_vocab.is_empty() || !screen_vocab.is_empty() {
-            let mut combined =
-                Vec::with_capacity(self.static_vocab.len() + screen_vocab.len());
-            combined.extend_from_slice(&self.static_vocab);
-            combined.extend_from_slice(screen_vocab);
-            if let Some(suffix) = crate::prompts::vocabulary_suffix(&combined) {
-                prompt_body.push_str(&suffix);
-            }
-        }
+        let prompt_body = self.prompt_body(screen_vocab);
         let user_msg = format!("{prompt_body}\n\nRaw transcript:\n{raw}");
         // Cleanup never summarizes (the prompt forbids it), so the cleaned text
         // tracks the input length — stripping filler makes it a touch shorter,
@@ -348,22 +352,16 @@ impl TextCleanupEngine {
         if raw.is_empty() {
             return Ok(String::new());
         }
-        let mut prompt_body = self.cleanup_prompt.clone();
-        if !self.static_vocab.is_empty() || !screen_vocab.is_empty() {
-            let mut combined =
-                Vec::with_capacity(self.static_vocab.len() + screen_vocab.len());
-            combined.extend_from_slice(&self.static_vocab);
-            combined.extend_from_slice(screen_vocab);
-            if let Some(suffix) = crate::prompts::vocabulary_suffix(&combined) {
-                prompt_body.push_str(&suffix);
-            }
-        }
-        // Tail (~240 chars) of the cleaned-so-far text for casing/flow continuity.
+        let mut prompt_body = self.prompt_body(screen_vocab).into_owned();
+        // Tail (PRIOR_CONTEXT_CHARS) of the cleaned-so-far text for casing/flow
+        // continuity.
         let prior = prior_cleaned.trim();
         if !prior.is_empty() {
-            let chars: Vec<char> = prior.chars().collect();
-            let start = chars.len().saturating_sub(240);
-            let tail: String = chars[start..].iter().collect();
+            let skip = prior.chars().count().saturating_sub(PRIOR_CONTEXT_CHARS);
+            let tail = match prior.char_indices().nth(skip) {
+                Some((i, _)) => &prior[i..],
+                None => prior,
+            };
             prompt_body.push_str(&format!(
                 "\n\nFor context, the preceding text (already cleaned, do not repeat it) ended with: {tail}\nClean only the new fragment below and output just the cleaned new fragment."
             ));
@@ -391,6 +389,25 @@ impl TextCleanupEngine {
         Ok(cleaned)
     }
 
+    /// The cleanup instructions plus the vocabulary block for this utterance.
+    /// Curated corrections come first (high-trust), then screen-harvested
+    /// terms; `vocabulary_suffix` dedups case-insensitively (first-seen casing
+    /// wins) and caps the total, so a noisy screen can't balloon the prompt.
+    /// With no screen terms this is the body precomputed at init.
+    fn prompt_body(&self, screen_vocab: &[String]) -> Cow<'_, str> {
+        if screen_vocab.is_empty() {
+            return Cow::Borrowed(&self.static_prompt_body);
+        }
+        let mut body = self.cleanup_prompt.clone();
+        let mut combined = Vec::with_capacity(self.static_vocab.len() + screen_vocab.len());
+        combined.extend_from_slice(&self.static_vocab);
+        combined.extend_from_slice(screen_vocab);
+        if let Some(suffix) = crate::prompts::vocabulary_suffix(&combined) {
+            body.push_str(&suffix);
+        }
+        Cow::Owned(body)
+    }
+
     /// Rough token count for sizing generation budgets / the context window.
     /// Uses the model's own tokenizer; falls back to a chars/3 estimate if
     /// tokenization fails (never on the hot path, but keeps this infallible).
@@ -74,7 +74,8 @@ pub fn paste_via_clipboard(text: &str) -> eyre::Result<()> {
 
     // Save current plain text (if any). We deliberately ignore errors here —
     // an empty / non-text clipboard is fine, we just won't restore anything.
-    let saved = cb.get_text().ok();
+    // A clipboard that already holds exactly this text needs no restore either.
+    let saved = cb.get_text().ok().filter(|orig| orig != text);
 
     cb.set_text(text)
         .map_err(|e| eyre::eyre!("Clipboard::set_text failed: {e}"))?;
@@ -85,27 +86,40 @@ pub fn paste_via_clipboard(text: &str) -> eyre::Result<()> {
 
     synthesize_cmd_v()?;
 
+    // The settle wait exists only to keep a restore from racing the target's
+    // paste handler. With nothing to restore, our text simply stays on the
+    // clipboard (a handy manual-paste fallback), so return without stalling
+    // the hot path for up to PASTE_SETTLE_MAX_MS.
+    let Some(orig) = saved else {
+        return Ok(());
+    };
+
     std::thread::sleep(Duration::from_millis(paste_settle_ms(text.chars().count())));
 
-    if let Some(orig) = saved {
-        // Don't clobber a fresh copy: if the changeCount advanced past our write,
-        // the user copied something during the settle window — leave it alone.
-        let user_copied = matches!(
-            (our_count, pasteboard_change_count()),
-            (Some(a), Some(b)) if b != a
-        );
-        if user_copied {
-            eprintln!("[clipboard] user copied during paste; leaving their clipboard intact");
-        } else {
-            let _ = cb.set_text(orig);
-        }
+    // Don't clobber a fresh copy: if the changeCount advanced past our write,
+    // the user copied something during the settle window — leave it alone.
+    let user_copied = matches!(
+        (our_count, pasteboard_change_count()),
+        (Some(a), Some(b)) if b != a
+    );
+    if user_copied {
+        eprintln!("[clipboard] user copied during paste; leaving their clipboard intact");
     } else {
-        // If the clipboard was empty before, leave our injected text on it
-        // (better than wiping it — gives the user a manual paste fallback).
+        let _ = cb.set_text(orig);
     }
     Ok(())
 }
 
+/// Put `text` on the general pasteboard and leave it there (no paste, no
+/// restore) — the menu's "Copy" actions. In-process via arboard/NSPasteboard
+/// rather than piping through a `pbcopy` child.
+pub fn copy_text(text: &str) -> eyre::Result<()> {
+    Clipboard::new()
+        .map_err(|e| eyre::eyre!("Clipboard::new failed: {e}"))?
+        .set_text(text)
+        .map_err(|e| eyre::eyre!("Clipboard::set_text failed: {e}"))
+}
+
 /// Time the OS needs to consume a synthesized Cmd+C and populate the
 /// pasteboard with the selection before we read it back.
 const COPY_SETTLE_MS: u64 = 140;
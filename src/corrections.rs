@@ -35,6 +35,7 @@
 //! period. When several keys could match at a word, the longest phrase wins.
 
 use serde::Deserialize;
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
 
@@ -262,16 +263,22 @@ impl Corrections {
     /// and the separators joining them). Words may be joined only by spaces or
     /// hyphens, so a phrase never spans a comma or period.
     fn match_phrase(&self, segs: &[Seg], start: usize) -> Option<(&str, usize)> {
-        let mut tokens: Vec<&str> = Vec::new();
-        let mut consumed: Vec<usize> = Vec::new(); // segs spanned when the phrase ends at this word
+        // One growing space-joined key plus the byte length at which each
+        // candidate phrase ends, so every probe is a slice of the same buffer
+        // rather than a fresh `join` per length.
+        let mut key = String::new();
+        let mut ends: Vec<(usize, usize)> = Vec::new(); // (key bytes, segs spanned)
         let mut j = start;
         loop {
             let Some(Seg::Word { lower, .. }) = segs.get(j) else {
                 break;
             };
-            tokens.push(lower.as_str());
-            consumed.push(j + 1 - start);
-            if tokens.len() >= self.max_phrase_tokens {
+            if !key.is_empty() {
+                key.push(' ');
+            }
+            key.push_str(lower);
+            ends.push((key.len(), j + 1 - start));
+            if ends.len() >= self.max_phrase_tokens {
                 break;
             }
             // Extend only across a joinable separator immediately followed by
@@ -281,51 +288,68 @@ impl Corrections {
                 _ => break,
             }
         }
-        for len in (1..=tokens.len()).rev() {
-            if let Some(rep) = self.phrases.get(&tokens[..len].join(" ")) {
-                return Some((rep.as_str(), consumed[len - 1]));
-            }
-        }
-        None
+        ends.iter().rev().find_map(|&(end, spanned)| {
+            self.phrases
+                .get(&key[..end])
+                .map(|rep| (rep.as_str(), spanned))
+        })
     }
 }
 
 /// A word (alphanumeric + apostrophe run) or a separator run. `apply` walks the
 /// input as these segments so it can match phrases across words while emitting
 /// the original casing and spacing verbatim for everything it doesn't replace.
-enum Seg {
-    Word { orig: String, lower: String },
-    Sep(String),
+/// Both variants borrow from the input; a word's lowercase key is owned only
+/// when lowercasing actually changes it.
+enum Seg<'a> {
+    Word { orig: &'a str, lower: Cow<'a, str> },
+    Sep(&'a str),
+}
+
+/// A word's lookup key. Most dictated words are already lowercase ASCII, and
+/// for those the key is just the word itself, so it is borrowed and not copied.
+/// Anything with an uppercase letter or a non-ASCII char goes through the full
+/// Unicode `to_lowercase`.
+fn lowercase_key(word: &str) -> Cow<'_, str> {
+    if word.bytes().all(|b| b.is_ascii() && !b.is_ascii_uppercase()) {
+        Cow::Borrowed(word)
+    } else {
+        Cow::Owned(word.to_lowercase())
+    }
 }
 
 /// Split text into alternating word/separator segments, preserving everything.
-fn segment(text: &str) -> Vec<Seg> {
-    let mut segs = Vec::new();
-    let mut word = String::new();
-    let mut sep = String::new();
-    for c in text.chars() {
-        if c.is_alphanumeric() || c == '\'' {
-            if !sep.is_empty() {
-                segs.push(Seg::Sep(std::mem::take(&mut sep)));
+/// One pass over the input, cutting byte ranges at each word/separator
+/// boundary instead of copying every run into its own buffer.
+fn segment(text: &str) -> Vec<Seg<'_>> {
+    fn run(text: &str, start: usize, end: usize, is_word: bool) -> Seg<'_> {
+        let s = &text[start..end];
+        if is_word {
+            Seg::Word {
+                orig: s,
+                lower: lowercase_key(s),
             }
-            word.push(c);
         } else {
-            if !word.is_empty() {
-                let lower = word.to_lowercase();
-                segs.push(Seg::Word {
-                    orig: std::mem::take(&mut word),
-                    lower,
-                });
-            }
-            sep.push(c);
+            Seg::Sep(s)
         }
     }
-    if !word.is_empty() {
-        let lower = word.to_lowercase();
-        segs.push(Seg::Word { orig: word, lower });
+
+    let mut segs = Vec::new();
+    let mut start = 0;
+    let mut in_word = None;
+    for (i, c) in text.char_indices() {
+        let is_word = c.is_alphanumeric() || c == '\'';
+        match in_word {
+            Some(prev) if prev != is_word => {
+                segs.push(run(text, start, i, prev));
+                start = i;
+            }
+            _ => {}
+        }
+        in_word = Some(is_word);
     }
-    if !sep.is_empty() {
-        segs.push(Seg::Sep(sep));
+    if let Some(prev) = in_word {
+        segs.push(run(text, start, text.len(), prev));
     }
     segs
 }
@@ -440,6 +464,14 @@ mod tests {
         assert_eq!(c.apply("... !!! ???"), "... !!! ???");
     }
 
+    #[test]
+    fn unmatched_text_passes_through_byte_for_byte() {
+        // Multi-byte words and separators survive the slice-based segmentation.
+        let c = dict(&[("lings", "Lingzi")]);
+        let text = "  Café — naïve lings,\tdon't… ";
+        assert_eq!(c.apply(text), "  Café — naïve Lingzi,\tdon't… ");
+    }
+
     #[test]
     fn matches_multi_word_phrase() {
         // The whole point of the rewrite: multi-word keys actually fire now.
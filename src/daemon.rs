@@ -29,7 +29,7 @@ use core_graphics::event::{
     CGEventType, CallbackResult, EventField,
 };
 use std::os::raw::c_void;
-use std::sync::atomic::{AtomicBool, AtomicPtr, AtomicU8, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicPtr, AtomicU32, AtomicU8, Ordering};
 use std::sync::mpsc;
 use std::sync::Arc;
 use std::time::{Duration, Instant};
@@ -44,14 +44,12 @@ fn secs(d: Duration) -> String {
     format!("{:.2}s", d.as_secs_f64())
 }
 
-/// Look up an app name from a PID via `ps`. Falls back to the bare PID
-/// if the lookup fails. Used purely for log readability.
+/// Look up an app name from a PID. Falls back to the bare PID if the lookup
+/// fails. Used purely for log readability — the per-utterance summary line
+/// calls it every dictation, so it reuses the injector's in-process
+/// [`process_path`](crate::injector::process_path) instead of forking `ps`.
 fn app_name(pid: i32) -> String {
-    std::process::Command::new("ps")
-        .args(["-o", "comm=", "-p", &pid.to_string()])
-        .output()
-        .ok()
-        .and_then(|o| String::from_utf8(o.stdout).ok())
+    crate::injector::process_path(pid)
         .map(|s| {
             // `/path/to/Visual Studio Code.app/Contents/MacOS/Code` →
             // `Visual Studio Code`
@@ -164,6 +162,14 @@ fn ptt_transition(state: u8, input: PttInput) -> (u8, PttDecision) {
 // hotkey would silently die. Null until the tap exists.
 static TAP_PORT: AtomicPtr<c_void> = AtomicPtr::new(std::ptr::null_mut());
 
+// How many times the callback has re-armed the tap since the worker last
+// reported it. The callback runs on the main run loop thread, which also feeds
+// the whole session's input stream, so it never logs itself — stderr can block
+// (a full pipe, a redirected log on a slow disk) and a stalled callback is
+// exactly what gets the tap disabled. It bumps this counter instead and the
+// worker surfaces it on the next event, off the input thread.
+static TAP_REARMS: AtomicU32 = AtomicU32::new(0);
+
 extern "C" {
     /// CoreGraphics: enable or disable a previously-created event tap.
     /// `void CGEventTapEnable(CFMachPortRef tap, bool enable);`
@@ -226,6 +232,10 @@ pub fn run(config: DaemonConfig) -> eyre::Result<()> {
         ));
     }
 
+    // Resolved once by `DaemonConfig::from_env` (env > settings.json >
+    // default); the callback only ever compares against this integer.
+    let hotkey_keycode = config.hotkey_keycode;
+
     let (tx, rx) = mpsc::channel::<DaemonEvent>();
 
     // Spawn the worker thread that owns the models + capture engine. It
@@ -241,7 +251,6 @@ pub fn run(config: DaemonConfig) -> eyre::Result<()> {
     // The CGEventTap callback runs on the main CFRunLoop thread. Keep it
     // FAST — just send to the worker.
     let tx_for_callback = tx.clone();
-    let hotkey_keycode = read_hotkey_keycode();
     // The hold is detected by watching the modifier-flag bit that THIS key
     // toggles — Option vs Command vs Control vs Shift. Without this, any
     // non-Option hotkey would never register a press (the old code checked
@@ -282,6 +291,7 @@ pub fn run(config: DaemonConfig) -> eyre::Result<()> {
                     if !p.is_null() {
                         unsafe { CGEventTapEnable(p, true) };
                     }
+                    TAP_REARMS.fetch_add(1, Ordering::Relaxed);
                 }
                 CGEventType::FlagsChanged => {
                     let keycode =
@@ -410,11 +420,6 @@ pub fn run(config: DaemonConfig) -> eyre::Result<()> {
     Ok(())
 }
 
-fn read_hotkey_keycode() -> i64 {
-    // Precedence: DICTATE_HOTKEY_KEYCODE env > settings.json > default.
-    crate::settings::Settings::load().resolve_hotkey(DEFAULT_HOTKEY_KEYCODE)
-}
-
 /// Map a modifier-key keycode to the CGEvent flag bit it toggles. On a
 /// FlagsChanged event the keycode tells us which physical key moved; this
 /// tells us which flag bit to read to know if it's now held or released.
@@ -429,31 +434,100 @@ fn keycode_to_modifier_flag(keycode: i64) -> CGEventFlags {
     }
 }
 
+/// Reply channel for one focus capture.
+type FocusReply = mpsc::Sender<eyre::Result<FocusTarget>>;
+
+/// A single long-lived thread that resolves the focused AX element on request.
+/// Each utterance used to spawn (and tear down) a fresh OS thread just to run
+/// `FocusTarget::capture` beside inference; now it hands this thread a reply
+/// channel instead. A per-request channel (rather than one shared result
+/// channel) means a capture nobody waited for — an utterance that bailed early
+/// on an empty transcript — can never be mistaken for the next one's target.
+struct FocusCapturer {
+    tx: mpsc::Sender<FocusReply>,
+}
+
+impl FocusCapturer {
+    fn spawn() -> Self {
+        let (tx, rx) = mpsc::channel::<FocusReply>();
+        let spawned = std::thread::Builder::new()
+            .name("focus-capture".into())
+            .spawn(move || {
+                for reply in rx {
+                    let _ = reply.send(FocusTarget::capture());
+                }
+            });
+        if let Err(e) = spawned {
+            eprintln!("[warn] focus-capture thread failed to start ({e}); capturing per utterance");
+        }
+        Self { tx }
+    }
+
+    /// Start a capture; the result arrives on the returned receiver.
+    fn request(&self) -> mpsc::Receiver<eyre::Result<FocusTarget>> {
+        let (reply_tx, reply_rx) = mpsc::channel();
+        if let Err(mpsc::SendError(reply_tx)) = self.tx.send(reply_tx) {
+            // The capture thread is gone — fall back to a one-off thread.
+            std::thread::spawn(move || {
+                let _ = reply_tx.send(FocusTarget::capture());
+            });
+        }
+        reply_rx
+    }
+}
+
+fn load_parakeet(config: &DaemonConfig) -> eyre::Result<LocalInferenceWorker> {
+    let t_load = Instant::now();
+    let worker = LocalInferenceWorker::initialize(&config.parakeet_dir)?;
+    eprintln!("[boot] parakeet    loaded in {:>4} ms", ms(t_load.elapsed()));
+    Ok(worker)
+}
+
+/// Load Parakeet and (unless `--no-cleanup`) the cleanup LLM. The two are
+/// independent — ONNX Runtime/CoreML on one side, llama.cpp/Metal on the other
+/// — so the LLM loads on a scoped thread while Parakeet loads here, and boot
+/// costs the slower of the two instead of their sum.
+#[cfg(feature = "cleaner")]
+fn load_models(
+    config: &DaemonConfig,
+) -> eyre::Result<(LocalInferenceWorker, Option<TextCleanupEngine>)> {
+    if config.no_cleanup {
+        eprintln!("[boot] cleaner     disabled (--no-cleanup)");
+        return Ok((load_parakeet(config)?, None));
+    }
+    std::thread::scope(|s| {
+        let cleaner = std::thread::Builder::new()
+            .name("cleaner-load".into())
+            .spawn_scoped(s, || {
+                let pretty = std::path::Path::new(&config.gemma_path)
+                    .file_name()
+                    .and_then(|s| s.to_str())
+                    .unwrap_or(&config.gemma_path);
+                let t = Instant::now();
+                let c = TextCleanupEngine::initialize(&config.gemma_path)?;
+                eprintln!(
+                    "[boot] cleaner     loaded in {:>4} ms · {pretty}",
+                    ms(t.elapsed())
+                );
+                Ok::<_, eyre::Report>(c)
+            })
+            .map_err(|e| eyre::eyre!("spawn cleaner loader failed: {e}"))?;
+        let worker = load_parakeet(config);
+        let cleaner = cleaner
+            .join()
+            .map_err(|_| eyre::eyre!("cleaner loader panicked"))??;
+        Ok((worker?, Some(cleaner)))
+    })
+}
+
 fn worker_loop(
     rx: std::sync::mpsc::Receiver<DaemonEvent>,
     config: DaemonConfig,
 ) -> eyre::Result<()> {
-    let t_load = Instant::now();
-    let mut worker = LocalInferenceWorker::initialize(&config.parakeet_dir)?;
-    eprintln!("[boot] parakeet    loaded in {:>4} ms", ms(t_load.elapsed()));
-
     #[cfg(feature = "cleaner")]
-    let cleaner = if !config.no_cleanup {
-        let pretty = std::path::Path::new(&config.gemma_path)
-            .file_name()
-            .and_then(|s| s.to_str())
-            .unwrap_or(&config.gemma_path);
-        let t = Instant::now();
-        let c = TextCleanupEngine::initialize(&config.gemma_path)?;
-        eprintln!(
-            "[boot] cleaner     loaded in {:>4} ms · {pretty}",
-            ms(t.elapsed())
-        );
-        Some(c)
-    } else {
-        eprintln!("[boot] cleaner     disabled (--no-cleanup)");
-        None
-    };
+    let (mut worker, cleaner) = load_models(&config)?;
+    #[cfg(not(feature = "cleaner"))]
+    let mut worker = load_parakeet(&config)?;
 
     // Tokio current-thread runtime for the async cleaner path.
     let rt = tokio::runtime::Builder::new_current_thread()
@@ -463,8 +537,7 @@ fn worker_loop(
     // Warm-up: first call pays graph-optimization + CoreML compile / Metal
     // shader compile costs. Pay them now so the first real utterance is hot.
     let t_warm = Instant::now();
-    let warm_silence = vec![0.0_f32; 16_000]; // 1 s of silence at 16 kHz
-    let _ = worker.transcribe_pcm(&warm_silence);
+    let _ = worker.warm_up();
     #[cfg(feature = "cleaner")]
     if let Some(ref c) = cleaner {
         let _ = rt.block_on(c.process_transcript("warmup")).ok();
@@ -495,7 +568,10 @@ fn worker_loop(
     // key press are retained, so the first words are never clipped and there's
     // no stream-open latency on press. `None` ⇒ the proven open-on-press path
     // (default). Created on the worker thread because the cpal Stream is !Send.
-    let preroll_ms = crate::settings::Settings::load().resolve_preroll_ms();
+    // Settings are read once here for every boot-time toggle below rather than
+    // re-reading and re-parsing settings.json per toggle.
+    let settings = crate::settings::Settings::load();
+    let preroll_ms = settings.resolve_preroll_ms();
     let mut always: Option<(crate::audio::AlwaysOnCapture, crate::audio::HeapAudioConsumer)> =
         if preroll_ms > 0 {
             let preroll = crate::audio::preroll_samples(preroll_ms);
@@ -536,7 +612,7 @@ fn worker_loop(
     #[cfg(feature = "cleaner")]
     let streaming = cleaner.is_some()
         && always.is_none()
-        && crate::settings::Settings::load().resolve_streaming_cleanup();
+        && settings.resolve_streaming_cleanup();
     #[cfg(not(feature = "cleaner"))]
     let streaming = false;
     if streaming {
@@ -546,7 +622,7 @@ fn worker_loop(
     // dictation must go through the LLM to be reshaped — so the short-utterance
     // deterministic shortcut is disabled. Default cleanup has no such need.
     #[cfg(feature = "cleaner")]
-    let format_active = crate::settings::Settings::load().resolve_format().is_some();
+    let format_active = settings.resolve_format().is_some();
     // Per-utterance streaming accumulators (only used when `streaming`).
     #[cfg(feature = "cleaner")]
     let mut stream: Option<crate::vad::SegmentStream> = None;
@@ -554,6 +630,7 @@ fn worker_loop(
     let mut stream_raw: Vec<String> = Vec::new();
     #[cfg(feature = "cleaner")]
     let mut stream_clean: Vec<String> = Vec::new();
+    let focus_capturer = FocusCapturer::spawn();
 
     'evloop: loop {
         // While recording in streaming mode, wake periodically to process any
@@ -590,6 +667,11 @@ fn worker_loop(
                 Err(_) => break,
             }
         };
+        // Report tap re-arms here, on the worker, never from the tap callback.
+        let rearms = TAP_REARMS.swap(0, Ordering::Relaxed);
+        if rearms > 0 {
+            eprintln!("[warn] event tap disabled by macOS {rearms}× · re-armed");
+        }
         match event {
             DaemonEvent::LatchArmed => {
                 // Hands-free engaged mid-hold: the mic keeps running once the
@@ -754,15 +836,11 @@ fn worker_loop(
                 let held = press_to_release.unwrap_or_default();
                 eprintln!("⏹ stopped · held {}", secs(held));
 
-                // Spawn AX focus capture in parallel with the inference
+                // Kick off AX focus capture in parallel with the inference
                 // pipeline. By the time Parakeet+Gemma finish, the focused
                 // element is already known — get_focused_element drops off
                 // the critical path.
-                let (target_tx, target_rx) =
-                    std::sync::mpsc::channel::<eyre::Result<FocusTarget>>();
-                std::thread::spawn(move || {
-                    let _ = target_tx.send(FocusTarget::capture());
-                });
+                let target_rx = focus_capturer.request();
 
                 let t_pipeline = Instant::now();
                 // When cleanup already happened per-segment during the hold,
@@ -783,7 +861,7 @@ fn worker_loop(
                         if let Some((ao, cons)) = always.as_mut() {
                             let recflag = ao.recording_flag();
                             let buf = crate::audio::drain_session(cons, &recflag);
-                            match worker.transcribe_pcm(&buf) {
+                            match worker.transcribe_owned(buf) {
                                 Ok(t) => break 'got t,
                                 Err(err) => {
                                     eprintln!("[err]  transcribe failed: {err:?}");
@@ -812,7 +890,8 @@ fn worker_loop(
                                 &mut stream_raw, &mut stream_clean, true,
                             );
                         }
-                        let whole = stream.as_ref().map(|s| s.buf().to_vec()).unwrap_or_default();
+                        // Done with the stream: take its buffer rather than copy it.
+                        let whole = stream.take().map(|s| s.into_buf()).unwrap_or_default();
                         // Use the streamed result only for genuinely multi-sentence
                         // dictations; short utterances / transforms fall back to the
                         // proven whole-buffer path so commands & transform still work.
@@ -826,19 +905,17 @@ fn worker_loop(
                             eprintln!("  ⟫ streamed {} sentence segment(s) during hold", stream_clean.len());
                             stream_raw.join(" ")
                         } else {
-                            match worker.transcribe_pcm(&whole) {
+                            match worker.transcribe_owned(whole) {
                                 Ok(t) => t,
                                 Err(err) => {
                                     eprintln!("[err]  transcribe failed: {err:?}");
                                     cues::play_error();
                                     ui_channel::set_state(UiState::Idle);
                                     eprintln!();
-                                    stream = None;
                                     continue 'evloop;
                                 }
                             }
                         };
-                        stream = None;
                         break 'got result;
                     }
                     match rt.block_on(worker.run_inference_pipeline(c, r)) {
@@ -1206,20 +1283,37 @@ fn handle_transform(
     }
 }
 
-/// Spoken prefix command (e.g. "translate to Chinese …"): run the resolved
+/// Trim a segment transcript without copying it: Parakeet's text usually
+/// carries a leading space, and `trim().to_string()` re-allocated every
+/// segment just to drop it. Trailing whitespace is truncated and any leading
+/// run shifted out within the same buffer.
+fn trim_owned(mut s: String) -> String {
+    s.truncate(s.trim_end().len());
+    let lead = s.len() - s.trim_start().len();
+    s.drain(..lead);
+    s
+}
+
+/// Transcribe one VAD segment for the streaming and listen loops: the trimmed
+/// text, or `None` when it came back empty or failed (logged as
+/// `[warn] {what}: …`) — either way the caller just moves on to the next one.
+fn transcribe_segment(worker: &mut LocalInferenceWorker, pcm: &[f32], what: &str) -> Option<String> {
+    match worker.transcribe_pcm(pcm) {
+        Ok(t) => Some(trim_owned(t)).filter(|t| !t.is_empty()),
+        Err(err) => {
+            eprintln!("[warn] {what}: {err:?}");
+            None
+        }
+    }
+}
+
 /// Pop everything currently sitting in the capture ring buffer (non-blocking).
 /// Used by the streaming path to pull newly captured audio on each tick + at
 /// release without waiting on the recording flag.
 #[cfg(feature = "cleaner")]
 fn drain_available(consumer: &mut crate::audio::HeapAudioConsumer) -> Vec<f32> {
-    use ringbuf::traits::{Consumer, Observer};
-    let n = consumer.occupied_len();
-    if n == 0 {
-        return Vec::new();
-    }
-    let mut buf = vec![0.0_f32; n];
-    let got = consumer.pop_slice(&mut buf);
-    buf.truncate(got);
+    let mut buf = Vec::new();
+    crate::audio::drain_into(consumer, &mut buf);
     buf
 }
 
@@ -1246,17 +1340,9 @@ fn stream_process(
     }
     let segs = if final_flush { st.take_final() } else { st.take_complete() };
     for (s, e) in segs {
-        let seg = st.buf()[s..e].to_vec();
-        let raw = match worker.transcribe_pcm(&seg) {
-            Ok(t) => t.trim().to_string(),
-            Err(err) => {
-                eprintln!("[warn] stream seg transcribe: {err:?}");
-                continue;
-            }
-        };
-        if raw.is_empty() {
+        let Some(raw) = transcribe_segment(worker, &st.buf()[s..e], "stream seg transcribe") else {
             continue;
-        }
+        };
         // Fix known proper nouns in this segment *before* cleanup — same as the
         // whole-buffer path — so the small model sees the intended spelling
         // (e.g. "to do list" → "Todoist") instead of mangling a garbled one.
@@ -1264,7 +1350,7 @@ fn stream_process(
         // Screen-context vocab isn't known until release (focus capture), so
         // streamed segments use the static corrections vocab only.
         let corrected = refiner.apply_corrections(&raw);
-        let prior = clean_acc.join(" ");
+        let prior = prior_context(clean_acc);
         let cleaned = match rt.block_on(cleaner.process_segment_with_context(&corrected, &[], &prior)) {
             Ok(c) => c,
             Err(err) => {
@@ -1278,6 +1364,25 @@ fn stream_process(
     }
 }
 
+/// Left-context for the next streamed segment: the trailing cleaned segments
+/// joined with spaces, stopping once they cover the cleaner's
+/// [`PRIOR_CONTEXT_CHARS`](crate::cleaner::PRIOR_CONTEXT_CHARS) window. Joining
+/// the whole accumulator per segment made each segment cost grow with the
+/// length of the dictation, when the cleaner only ever reads the tail.
+#[cfg(feature = "cleaner")]
+fn prior_context(clean_acc: &[String]) -> String {
+    // `+ 1` per segment counts its joining space; the suffix is `chars - 1`
+    // long, so stop only once that reaches the window.
+    let mut chars = 0;
+    let mut first = clean_acc.len();
+    while first > 0 && chars <= crate::cleaner::PRIOR_CONTEXT_CHARS {
+        first -= 1;
+        chars += clean_acc[first].chars().count() + 1;
+    }
+    clean_acc[first..].join(" ")
+}
+
+/// Spoken prefix command (e.g. "translate to Chinese …"): run the resolved
 /// transform on the spoken body with the warm Gemma engine and inject the result
 /// at the cursor, like a normal dictation. Unlike `handle_transform` there's no
 /// selection and no clipboard round-trip — the body is fresh speech, so we
@@ -1343,7 +1448,7 @@ fn handle_spoken_command(
 /// this function is the I/O loop around it. No CGEventTap, no menu bar.
 pub fn run_listen(config: DaemonConfig) -> eyre::Result<()> {
     use crate::audio::{AlwaysOnCapture, BUFFER_CAPACITY, SAMPLE_RATE};
-    use ringbuf::traits::{Consumer, Observer};
+    use ringbuf::traits::Consumer;
 
     if !AccessibilityInjector::check_permission() {
         return Err(eyre::eyre!(
@@ -1354,28 +1459,20 @@ pub fn run_listen(config: DaemonConfig) -> eyre::Result<()> {
 
     let settings = crate::settings::Settings::load();
     let wake_word = settings.resolve_wake_word();
-
-    let t_load = Instant::now();
-    let mut worker = LocalInferenceWorker::initialize(&config.parakeet_dir)?;
-    eprintln!("[boot] parakeet    loaded in {:>4} ms", ms(t_load.elapsed()));
+    let wake = crate::wake_word::WakeWord::new(&wake_word);
+    let energy_gate = settings.resolve_listen_energy_gate();
 
     #[cfg(feature = "cleaner")]
-    let cleaner = if !config.no_cleanup {
-        let t = Instant::now();
-        let c = TextCleanupEngine::initialize(&config.gemma_path)?;
-        eprintln!("[boot] cleaner     loaded in {:>4} ms", ms(t.elapsed()));
-        Some(c)
-    } else {
-        eprintln!("[boot] cleaner     disabled (--no-cleanup)");
-        None
-    };
+    let (mut worker, cleaner) = load_models(&config)?;
+    #[cfg(not(feature = "cleaner"))]
+    let mut worker = load_parakeet(&config)?;
 
     let rt = tokio::runtime::Builder::new_current_thread()
         .enable_all()
         .build()?;
 
     // Warm both models so the first heard utterance is hot.
-    let _ = worker.transcribe_pcm(&vec![0.0_f32; SAMPLE_RATE as usize]);
+    let _ = worker.warm_up();
     #[cfg(feature = "cleaner")]
     if let Some(ref c) = cleaner {
         let _ = rt.block_on(c.process_transcript("warmup")).ok();
@@ -1408,31 +1505,40 @@ pub fn run_listen(config: DaemonConfig) -> eyre::Result<()> {
     eprintln!();
 
     loop {
-        // Non-blocking drain of whatever the mic callback has queued.
-        let pending = cons.occupied_len();
+        // Non-blocking drain of whatever the mic callback has queued, copied
+        // straight from the ring's two halves into the VAD buffer — no per-tick
+        // scratch chunk to allocate, zero-fill and copy through.
+        let (head, tail) = cons.as_slices();
+        let pending = head.len() + tail.len();
         if pending > 0 {
-            let mut chunk = vec![0.0_f32; pending];
-            let got = cons.pop_slice(&mut chunk);
-            seg_stream.push(&chunk[..got]);
+            seg_stream.push(head);
+            seg_stream.push(tail);
+            cons.skip(pending);
         }
 
         for (s, e) in seg_stream.take_complete() {
-            let seg = seg_stream.buf()[s..e].to_vec();
-            let raw = match worker.transcribe_pcm(&seg) {
-                Ok(t) => t.trim().to_string(),
-                Err(err) => {
-                    eprintln!("[warn] transcribe: {err:?}");
+            // Opt-in energy gate: the VAD is peak-relative, so silence between
+            // dictations still yields noise "segments". Skip the ASR call when
+            // the segment never rises above room tone — logged, so a missed
+            // quiet wake phrase shows up with its level.
+            if energy_gate {
+                let level = crate::vad::rms(&seg_stream.buf()[s..e]);
+                if level < crate::vad::MIN_SPEECH_RMS {
+                    eprintln!(
+                        "  ·    (gated) rms {level:.4} < {} · skipped ASR",
+                        crate::vad::MIN_SPEECH_RMS
+                    );
                     continue;
                 }
-            };
-            if raw.is_empty() {
-                continue;
             }
+            let Some(raw) = transcribe_segment(&mut worker, &seg_stream.buf()[s..e], "transcribe") else {
+                continue;
+            };
 
             // Decide whether this segment is dictation: either it opens with the
             // wake word, or we're still armed from a recent trigger.
             let armed = armed_until.map(|t| Instant::now() < t).unwrap_or(false);
-            let body = match crate::wake_word::detect(&raw, &wake_word) {
+            let body = match wake.detect(&raw) {
                 Some(m) => m.body,                 // wake word heard → its body
                 None if armed => raw.clone(),      // armed continuation → whole segment
                 None => {
@@ -1692,4 +1798,25 @@ mod tests {
         ]);
         assert_eq!(end, ST_IDLE);
     }
+
+    #[test]
+    fn trim_owned_matches_trim() {
+        for s in ["", "   ", " Hello world.", "Hello \n", "\t Héllo wörld \u{3000}", "x"] {
+            assert_eq!(trim_owned(s.to_string()), s.trim());
+        }
+    }
+
+    #[cfg(feature = "cleaner")]
+    #[test]
+    fn prior_context_is_a_suffix_covering_the_window() {
+        let segs: Vec<String> = (0..40).map(|i| format!("Sentence number {i} is here.")).collect();
+        let full = segs.join(" ");
+        let prior = prior_context(&segs);
+        assert!(full.ends_with(&prior));
+        assert!(prior.chars().count() >= crate::cleaner::PRIOR_CONTEXT_CHARS);
+        assert!(prior.len() < full.len());
+        // Short accumulators come back whole; empty stays empty.
+        assert_eq!(prior_context(&segs[..2]), segs[..2].join(" "));
+        assert_eq!(prior_context(&[]), "");
+    }
 }
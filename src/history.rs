@@ -18,9 +18,15 @@
 //! ```
 //!
 //! Writes are best-effort: a failure to persist history must never break the
-//! dictation hot path, so `record` logs and swallows errors. Connections are
-//! opened per-call — dictation happens at human speed, so the open cost is
-//! irrelevant and we sidestep sharing a `Connection` across threads.
+//! dictation hot path, so `record` logs and swallows errors. One connection is
+//! opened lazily and kept for the process lifetime behind a mutex: `record`
+//! runs right after every inject, and reopening the file, re-reading the schema
+//! and re-running the `CREATE … IF NOT EXISTS` batch each time was pure
+//! overhead. Statements go through `prepare_cached`. Any error drops the cached
+//! handle so the next call reopens. Deleting or replacing the file raises no
+//! error on an open handle (writes would land in the unlinked inode and be
+//! lost), so each call also checks that the path still names the file that was
+//! opened, and reopens when it doesn't.
 //!
 //! This module is just the data layer. Presentation (the native history
 //! window's date grouping + local-time formatting) lives in `menubar`, where
@@ -28,6 +34,7 @@
 
 use rusqlite::Connection;
 use std::path::PathBuf;
+use std::sync::Mutex;
 use std::time::{SystemTime, UNIX_EPOCH};
 
 /// One stored dictation.
@@ -43,13 +50,26 @@ fn db_path() -> Option<PathBuf> {
     crate::app_paths::config_file("history.db")
 }
 
-/// Open the history DB, creating the directory, file and schema as needed.
-fn open() -> eyre::Result<Connection> {
-    let path = db_path().ok_or_else(|| eyre::eyre!("cannot resolve history path ($HOME unset)"))?;
+/// A cached connection plus the inode of the file it opened. `None` until the
+/// first call, and again after any error.
+type ConnSlot = Mutex<Option<(Connection, u64)>>;
+
+/// The process-wide history connection, opened on first use by [`with_conn`].
+static CONN: ConnSlot = Mutex::new(None);
+
+/// Inode currently at `path`, or `None` if nothing is there.
+fn inode(path: &std::path::Path) -> Option<u64> {
+    use std::os::unix::fs::MetadataExt;
+    std::fs::metadata(path).ok().map(|m| m.ino())
+}
+
+/// Open the history DB at `path`, creating the directory, file and schema as
+/// needed.
+fn open(path: &std::path::Path) -> eyre::Result<Connection> {
     if let Some(dir) = path.parent() {
         std::fs::create_dir_all(dir).map_err(|e| eyre::eyre!("create {}: {e}", dir.display()))?;
     }
-    let conn = Connection::open(&path)?;
+    let conn = Connection::open(path)?;
     conn.execute_batch(
         "CREATE TABLE IF NOT EXISTS dictations (
              id         INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -62,6 +82,37 @@ fn open() -> eyre::Result<Connection> {
     Ok(conn)
 }
 
+/// Run `f` against the shared connection at [`db_path`].
+fn with_conn<T>(f: impl FnOnce(&Connection) -> rusqlite::Result<T>) -> eyre::Result<T> {
+    let path = db_path().ok_or_else(|| eyre::eyre!("cannot resolve history path ($HOME unset)"))?;
+    with_conn_in(&CONN, &path, f)
+}
+
+/// Run `f` against the connection cached in `slot`, opening `path` on first
+/// use, or again when the file at `path` is no longer the one the handle has
+/// open (deleted or replaced). On any error the handle is discarded so the
+/// next call starts from a fresh open.
+fn with_conn_in<T>(
+    slot: &ConnSlot,
+    path: &std::path::Path,
+    f: impl FnOnce(&Connection) -> rusqlite::Result<T>,
+) -> eyre::Result<T> {
+    let mut guard = slot
+        .lock()
+        .map_err(|_| eyre::eyre!("history connection lock poisoned"))?;
+    let (conn, ino) = match guard.take() {
+        Some((c, ino)) if inode(path) == Some(ino) => (c, ino),
+        _ => {
+            let c = open(path)?;
+            let ino = inode(path).ok_or_else(|| eyre::eyre!("{} vanished after open", path.display()))?;
+            (c, ino)
+        }
+    };
+    let out = f(&conn)?;
+    *guard = Some((conn, ino));
+    Ok(out)
+}
+
 /// Persist one dictation. Best-effort: errors are logged, never propagated,
 /// so a history hiccup can't interrupt the inject hot path.
 pub fn record(text: &str) {
@@ -79,23 +130,23 @@ fn try_record(text: &str) -> eyre::Result<()> {
         .duration_since(UNIX_EPOCH)
         .map(|d| d.as_secs() as i64)
         .unwrap_or(0);
-    let conn = open()?;
-    conn.execute(
-        "INSERT INTO dictations (text, created_at) VALUES (?1, ?2)",
-        rusqlite::params![text, now],
-    )?;
+    with_conn(|conn| insert(conn, text, now))
+}
+
+fn insert(conn: &Connection, text: &str, created_at: i64) -> rusqlite::Result<()> {
+    conn.prepare_cached("INSERT INTO dictations (text, created_at) VALUES (?1, ?2)")?
+        .execute(rusqlite::params![text, created_at])?;
     Ok(())
 }
 
 /// Most-recent-first dictations, capped at `limit`. Returns an empty vec on
 /// any error (a missing DB just means "no history yet").
 pub fn recent(limit: usize) -> Vec<Entry> {
-    try_recent(limit).unwrap_or_default()
+    with_conn(|conn| select_recent(conn, limit)).unwrap_or_default()
 }
 
-fn try_recent(limit: usize) -> eyre::Result<Vec<Entry>> {
-    let conn = open()?;
-    let mut stmt = conn.prepare(
+fn select_recent(conn: &Connection, limit: usize) -> rusqlite::Result<Vec<Entry>> {
+    let mut stmt = conn.prepare_cached(
         "SELECT text, created_at FROM dictations
          ORDER BY created_at DESC, id DESC
          LIMIT ?1",
@@ -112,3 +163,44 @@ fn try_recent(limit: usize) -> eyre::Result<Vec<Entry>> {
     }
     Ok(out)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn texts(slot: &ConnSlot, path: &std::path::Path) -> Vec<String> {
+        with_conn_in(slot, path, |c| select_recent(c, 10))
+            .unwrap()
+            .into_iter()
+            .map(|e| e.text)
+            .collect()
+    }
+
+    #[test]
+    fn cached_connection_follows_the_file_at_the_path() {
+        let dir = std::env::temp_dir().join(format!("history-test-{}", std::process::id()));
+        let path = dir.join("history.db");
+        let _ = std::fs::remove_dir_all(&dir);
+        let slot = ConnSlot::new(None);
+
+        with_conn_in(&slot, &path, |c| insert(c, "first", 1)).unwrap();
+        assert_eq!(texts(&slot, &path), ["first"]);
+
+        // Deleted under a live handle: the next write recreates the file
+        // instead of landing in the unlinked inode.
+        std::fs::remove_file(&path).unwrap();
+        with_conn_in(&slot, &path, |c| insert(c, "second", 2)).unwrap();
+        assert!(path.exists(), "record recreated the file");
+        assert_eq!(texts(&slot, &path), ["second"]);
+
+        // Replaced under a live handle: reads and writes follow the new file.
+        let other = dir.join("other.db");
+        with_conn_in(&ConnSlot::new(None), &other, |c| insert(c, "replacement", 3)).unwrap();
+        std::fs::rename(&other, &path).unwrap();
+        assert_eq!(texts(&slot, &path), ["replacement"]);
+        with_conn_in(&slot, &path, |c| insert(c, "third", 4)).unwrap();
+        assert_eq!(texts(&slot, &path), ["third", "replacement"]);
+
+        let _ = std::fs::remove_dir_all(&dir);
+    }
+}
@@ -55,8 +55,8 @@ fn is_ax_blind(pid: i32) -> bool {
     matches!(AX_BLIND_PID.lock().ok().and_then(|g| *g), Some(p) if p == pid)
 }
 
-/// Cache of `pid → (is_electron, is_terminal)`, looked up via `ps` once per
-/// PID. Both injection routing and cleanup gating read from it.
+/// Cache of `pid → (is_electron, is_terminal)`, looked up via [`process_path`]
+/// once per PID. Both injection routing and cleanup gating read from it.
 ///
 /// Two families of apps report an editable AX role (AXTextField / AXTextArea)
 /// and accept `kAXSelectedText` writes with `kAXErrorSuccess`, but their
@@ -73,6 +73,20 @@ fn is_ax_blind(pid: i32) -> bool {
 ///      err=0 on set_selected_text yet nothing renders.
 static CLIPBOARD_ONLY_CACHE: Mutex<Vec<(i32, bool, bool)>> = Mutex::new(Vec::new());
 
+/// Most PIDs any per-PID cache here remembers. A daemon that runs for weeks
+/// sees many short-lived processes; without a cap the caches grow for the life
+/// of the process and every lookup scans all of them. Far above the number of
+/// apps anyone dictates into in one stretch, so eviction only drops stale PIDs.
+const PID_CACHE_CAP: usize = 64;
+
+/// Append to a per-PID cache, evicting the oldest entry once it's full.
+fn push_bounded<T>(cache: &mut Vec<T>, entry: T) {
+    if cache.len() >= PID_CACHE_CAP {
+        cache.remove(0);
+    }
+    cache.push(entry);
+}
+
 /// Classify a PID by its executable name into `(is_electron, is_terminal)`.
 /// Both flags route to clipboard paste; `is_terminal` additionally lets the
 /// daemon skip prose cleanup (you almost never want Gemma rewriting a shell
@@ -85,12 +99,7 @@ fn classify_pid(pid: i32) -> (bool, bool) {
             }
         }
     }
-    let comm = std::process::Command::new("ps")
-        .args(["-o", "comm=", "-p", &pid.to_string()])
-        .output()
-        .ok()
-        .map(|o| String::from_utf8_lossy(&o.stdout).to_lowercase())
-        .unwrap_or_default();
+    let comm = process_path(pid).unwrap_or_default().to_lowercase();
     let is_electron = comm.contains("/electron")
         || comm.contains("visual studio code")
         || comm.contains("/code helper")
@@ -120,11 +129,39 @@ fn classify_pid(pid: i32) -> (bool, bool) {
         || comm.contains("/kitty")
         || comm.contains("/alacritty");
     if let Ok(mut cache) = CLIPBOARD_ONLY_CACHE.lock() {
-        cache.push((pid, is_electron, is_terminal));
+        push_bounded(&mut cache, (pid, is_electron, is_terminal));
     }
     (is_electron, is_terminal)
 }
 
+/// Full executable path of `pid` (e.g. `/Applications/Ghostty.app/Contents/
+/// MacOS/ghostty`), or `None` if the process is gone. On macOS this is a
+/// single in-process `proc_pidpath` call — the first inject into a new app
+/// used to fork+exec `ps` for the same string, tens of ms on the hot path.
+#[cfg(target_os = "macos")]
+pub fn process_path(pid: i32) -> Option<String> {
+    let mut buf = vec![0u8; libc::PROC_PIDPATHINFO_MAXSIZE as usize];
+    let n = unsafe {
+        libc::proc_pidpath(pid, buf.as_mut_ptr() as *mut libc::c_void, buf.len() as u32)
+    };
+    if n <= 0 {
+        return None;
+    }
+    buf.truncate(n as usize);
+    Some(String::from_utf8_lossy(&buf).into_owned())
+}
+
+/// Non-macOS builds (tests, CI) have no `proc_pidpath`; ask `ps` instead.
+#[cfg(not(target_os = "macos"))]
+pub fn process_path(pid: i32) -> Option<String> {
+    std::process::Command::new("ps")
+        .args(["-o", "comm=", "-p", &pid.to_string()])
+        .output()
+        .ok()
+        .map(|o| String::from_utf8_lossy(&o.stdout).trim().to_string())
+        .filter(|s| !s.is_empty())
+}
+
 pub fn is_clipboard_only_pid(pid: i32) -> bool {
     let (is_electron, is_terminal) = classify_pid(pid);
     is_electron || is_terminal
@@ -154,7 +191,7 @@ fn is_ax_verified(pid: i32) -> bool {
 fn mark_ax_verified(pid: i32) {
     if let Ok(mut g) = AX_VERIFIED_PID.lock() {
         if !g.contains(&pid) {
-            g.push(pid);
+            push_bounded(&mut g, pid);
         }
     }
 }
@@ -170,7 +207,7 @@ fn mark_clipboard_only(pid: i32) {
         if let Some(entry) = cache.iter_mut().find(|(p, _, _)| *p == pid) {
             entry.1 = true;
         } else {
-            cache.push((pid, true, false));
+            push_bounded(&mut cache, (pid, true, false));
         }
     }
 }
@@ -863,3 +900,19 @@ impl AccessibilityInjector {
         true
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn pid_caches_evict_oldest_at_cap() {
+        let mut cache = Vec::new();
+        for pid in 0..(PID_CACHE_CAP as i32 + 3) {
+            push_bounded(&mut cache, pid);
+        }
+        assert_eq!(cache.len(), PID_CACHE_CAP);
+        assert_eq!(cache.first(), Some(&3));
+        assert_eq!(cache.last(), Some(&(PID_CACHE_CAP as i32 + 2)));
+    }
+}
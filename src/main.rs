@@ -101,6 +101,36 @@ fn run_inject_test(text: Option<String>) -> eyre::Result<()> {
     Ok(())
 }
 
+/// FOCUS_APP setup script: bring the app forward with a writable document,
+/// nudge its field, and print the app's PID. Constant text, with the app name
+/// passed as `argv` — one osascript launch per call instead of two, and no
+/// interpolating the name into script source (so a quote in it can't break
+/// the parse). The Standard Suite terms (`documents`, `make new document`) are
+/// borrowed from TextEdit because the target is only known at run time. Setup
+/// is best-effort inside `try` — apps without documents, or a denied System
+/// Events keystroke, must not stop the PID lookup at the end.
+const FOCUS_APP_SCRIPT: &str = "on run argv
+    set appName to item 1 of argv
+    try
+        using terms from application \"TextEdit\"
+            tell application appName
+                activate
+                if (count of documents) is 0 then make new document
+            end tell
+        end using terms from
+    end try
+    try
+        delay 0.5
+        tell application \"System Events\"
+            tell process appName to set frontmost to true
+            delay 0.2
+            keystroke \" \"
+            key code 51
+        end tell
+    end try
+    tell application \"System Events\" to return unix id of first process whose name is appName
+end run";
+
 /// If FOCUS_APP is set, ensure that app has a writable doc and inject into
 /// its AXUIElement by PID (works even when cargo's terminal is OS-frontmost).
 /// Otherwise inject via the system-wide focused element (production path).
@@ -108,28 +138,9 @@ fn inject_with_optional_focus(text: &str) -> eyre::Result<()> {
     let Ok(app) = std::env::var("FOCUS_APP") else {
         return AccessibilityInjector::inject_text(text);
     };
-    let setup = format!(
-        "tell application \"{app}\"\n\
-            activate\n\
-            if (count of documents) is 0 then make new document\n\
-         end tell\n\
-         delay 0.5\n\
-         tell application \"System Events\"\n\
-            tell process \"{app}\" to set frontmost to true\n\
-            delay 0.2\n\
-            keystroke \" \"\n\
-            key code 51\n\
-         end tell"
-    );
-    let _ = std::process::Command::new("osascript")
-        .args(["-e", &setup])
-        .status();
-    // Resolve PID — Unix id of frontmost process named `app`.
-    let pid_script = format!(
-        "tell application \"System Events\" to get unix id of first process whose name is \"{app}\""
-    );
+    // Set up focus and resolve the PID of the process named `app` in one run.
     let out = std::process::Command::new("osascript")
-        .args(["-e", &pid_script])
+        .args(["-e", FOCUS_APP_SCRIPT, &app])
         .output()?;
     let pid: i32 = String::from_utf8_lossy(&out.stdout)
         .trim()
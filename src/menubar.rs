@@ -898,13 +898,8 @@ fn terminate_app() {
 // ─── Menu action helpers (plain Rust, no AppKit) ────────────────────────
 
 fn copy_to_clipboard(text: &str) {
-    use std::io::Write;
-    use std::process::{Command, Stdio};
-    if let Ok(mut child) = Command::new("pbcopy").stdin(Stdio::piped()).spawn() {
-        if let Some(mut stdin) = child.stdin.take() {
-            let _ = stdin.write_all(text.as_bytes());
-        }
-        let _ = child.wait();
+    if let Err(e) = crate::clipboard_paste::copy_text(text) {
+        eprintln!("[menu] copy to clipboard failed: {e}");
     }
 }
 
@@ -89,6 +89,12 @@ pub struct Settings {
     /// [`DEFAULT_WAKE_WORD`]. Override: `DICTATE_WAKE_WORD`.
     #[serde(default, skip_serializing_if = "Option::is_none")]
     pub wake_word: Option<String>,
+    /// EXPERIMENTAL: in listen mode, skip the ASR call for VAD segments quieter
+    /// than [`crate::vad::MIN_SPEECH_RMS`]. The threshold is unmeasured on real
+    /// mic audio and could drop a soft wake phrase, so `None`/false ⇒ off (every
+    /// segment is transcribed). Override: `DICTATE_LISTEN_ENERGY_GATE=1`.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub listen_energy_gate: Option<bool>,
 }
 
 /// Default wake word for listen mode. Two distinct syllables, uncommon as a
@@ -172,6 +178,16 @@ impl Settings {
         self.listen_mode.unwrap_or(false)
     }
 
+    /// Resolve the listen-mode energy gate: `DICTATE_LISTEN_ENERGY_GATE` env >
+    /// settings > false.
+    pub fn resolve_listen_energy_gate(&self) -> bool {
+        if let Ok(v) = std::env::var("DICTATE_LISTEN_ENERGY_GATE") {
+            let v = v.trim().to_ascii_lowercase();
+            return matches!(v.as_str(), "1" | "true" | "on" | "yes");
+        }
+        self.listen_energy_gate.unwrap_or(false)
+    }
+
     /// Resolve the wake word: `DICTATE_WAKE_WORD` env > settings > default.
     /// Blank/whitespace falls back to [`DEFAULT_WAKE_WORD`].
     pub fn resolve_wake_word(&self) -> String {
@@ -447,6 +463,16 @@ mod tests {
         }
     }
 
+    #[test]
+    fn listen_energy_gate_off_by_default() {
+        if std::env::var_os("DICTATE_LISTEN_ENERGY_GATE").is_none() {
+            assert!(!Settings::default().resolve_listen_energy_gate());
+            let mut s = Settings::default();
+            s.listen_energy_gate = Some(true);
+            assert!(s.resolve_listen_energy_gate());
+        }
+    }
+
     #[test]
     fn wake_word_falls_back_to_default_when_blank() {
         if std::env::var_os("DICTATE_WAKE_WORD").is_none() {
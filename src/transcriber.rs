@@ -4,6 +4,12 @@ use std::sync::{atomic::AtomicBool, Arc};
 #[cfg(feature = "parakeet")]
 use parakeet_rs::{ParakeetTDT, TimestampMode, Transcriber};
 
+/// Length of the boot warm-up clip: 1 s at 16 kHz. Unlike whisper.cpp, Parakeet
+/// doesn't pad every input to a fixed 30 s window, so a much shorter clip would
+/// warm a sequence length no real dictation uses. A second is close to the
+/// shortest push-to-talk utterance.
+pub const WARMUP_SAMPLES: usize = SAMPLE_RATE as usize;
+
 pub struct LocalInferenceWorker {
     #[cfg(feature = "parakeet")]
     model: ParakeetTDT,
@@ -29,6 +35,14 @@ impl LocalInferenceWorker {
         panic!("initialize_mock is unavailable when built with the `parakeet` feature; call initialize(path) instead");
     }
 
+    /// Run one throwaway inference on [`WARMUP_SAMPLES`] of silence so the first
+    /// real utterance doesn't pay graph-optimization + CoreML compile costs.
+    /// The buffer is built owned and handed over as-is; `vec![0.0; n]` is a
+    /// zeroed allocation, so there's no fill and no `transcribe_pcm` copy.
+    pub fn warm_up(&mut self) -> eyre::Result<()> {
+        self.transcribe_owned(vec![0.0_f32; WARMUP_SAMPLES]).map(drop)
+    }
+
     /// Drain the SPSC ring buffer until capture stops, then run inference on
     /// the accumulated samples. The drain/termination logic lives in
     /// `audio::drain_until_stopped`; this just composes it with the model.
@@ -38,12 +52,26 @@ impl LocalInferenceWorker {
         is_recording: Arc<AtomicBool>,
     ) -> eyre::Result<String> {
         let audio_buffer = drain_until_stopped(consumer, is_recording).await;
-        self.transcribe_pcm(&audio_buffer)
+        self.transcribe_owned(audio_buffer)
     }
 
     /// Synchronously transcribe a slice of 16 kHz mono f32 samples.
     /// Mock build returns a deterministic placeholder string.
+    ///
+    /// parakeet-rs takes its input by value, so this copies the slice. Callers
+    /// that already own a buffer they're done with should use
+    /// [`Self::transcribe_owned`] and skip the copy.
     pub fn transcribe_pcm(&mut self, audio: &[f32]) -> eyre::Result<String> {
+        if audio.is_empty() {
+            return Ok(String::new());
+        }
+        self.transcribe_owned(audio.to_vec())
+    }
+
+    /// Like [`Self::transcribe_pcm`] but consumes the buffer, handing it to the
+    /// model as-is. The drained utterance (up to minutes of audio) moves
+    /// straight from the capture drain into inference with no extra copy.
+    pub fn transcribe_owned(&mut self, audio: Vec<f32>) -> eyre::Result<String> {
         if audio.is_empty() {
             return Ok(String::new());
         }
@@ -51,12 +79,7 @@ impl LocalInferenceWorker {
         {
             let result = self
                 .model
-                .transcribe_samples(
-                    audio.to_vec(),
-                    SAMPLE_RATE,
-                    1,
-                    Some(TimestampMode::Sentences),
-                )
+                .transcribe_samples(audio, SAMPLE_RATE, 1, Some(TimestampMode::Sentences))
                 .map_err(|e| eyre::eyre!("transcribe_samples failed: {e:?}"))?;
             Ok(result.text)
         }
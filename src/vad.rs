@@ -45,37 +45,46 @@ pub fn segment_speech(audio: &[f32], sr: u32, cfg: &VadConfig) -> Vec<(usize, us
         return vec![(0, audio.len())];
     }
 
+    // One pass over the samples yields the per-frame RMS and the running peak;
+    // the speech decision is then a compare against `thresh` at the point of
+    // use rather than a separate mask-building pass.
+    let mut peak = 0.0f32;
     let rms: Vec<f32> = audio
         .chunks(frame)
-        .map(|c| (c.iter().map(|x| x * x).sum::<f32>() / c.len() as f32).sqrt())
+        .map(|c| {
+            let r = (c.iter().map(|x| x * x).sum::<f32>() / c.len() as f32).sqrt();
+            peak = peak.max(r);
+            r
+        })
         .collect();
-    let peak = rms.iter().cloned().fold(0.0f32, f32::max).max(1e-9);
-    let thresh = cfg.peak_frac * peak;
-    let speech: Vec<bool> = rms.iter().map(|&r| r > thresh).collect();
+    let thresh = cfg.peak_frac * peak.max(1e-9);
 
+    // One forward pass over the frames. `open` is the current speech run as
+    // (first, last speech frame); `silent` counts the frames since its last
+    // speech frame, so closing a run on a long-enough pause is an integer
+    // compare per frame rather than a rescan.
+    let close = |(start, last): (usize, usize)| {
+        let s = (start * frame).saturating_sub(pad);
+        let e = ((last + 1) * frame + pad).min(audio.len());
+        (s, e.max(s + 1))
+    };
     let mut segs: Vec<(usize, usize)> = Vec::new();
-    let mut i = 0;
-    while i < speech.len() {
-        if !speech[i] {
-            i += 1;
-            continue;
-        }
-        // Start of a speech run; extend until a long-enough silence gap.
-        let start = i;
-        let mut last_speech = i;
-        let mut j = i + 1;
-        while j < speech.len() {
-            if speech[j] {
-                last_speech = j;
-            } else if j - last_speech >= min_pause_frames {
-                break;
+    let mut open: Option<(usize, usize)> = None;
+    let mut silent = 0;
+    for (k, &r) in rms.iter().enumerate() {
+        if r > thresh {
+            open = Some(open.map_or((k, k), |(start, _)| (start, k)));
+            silent = 0;
+        } else if let Some(run) = open {
+            silent += 1;
+            if silent >= min_pause_frames {
+                segs.push(close(run));
+                open = None;
             }
-            j += 1;
         }
-        let s = (start * frame).saturating_sub(pad);
-        let e = ((last_speech + 1) * frame + pad).min(audio.len());
-        segs.push((s, e.max(s + 1)));
-        i = j;
+    }
+    if let Some(run) = open {
+        segs.push(close(run));
     }
     if segs.is_empty() {
         segs.push((0, audio.len()));
@@ -83,6 +92,22 @@ pub fn segment_speech(audio: &[f32], sr: u32, cfg: &VadConfig) -> Vec<(usize, us
     segs
 }
 
+/// Root-mean-square level of `samples` (0.0 for an empty slice).
+pub fn rms(samples: &[f32]) -> f32 {
+    if samples.is_empty() {
+        return 0.0;
+    }
+    (samples.iter().map(|x| x * x).sum::<f32>() / samples.len() as f32).sqrt()
+}
+
+/// Absolute level below which a VAD segment is treated as room tone rather
+/// than speech (≈ −46 dBFS). [`segment_speech`]'s threshold is relative to the
+/// clip's own peak, so in a quiet room it happily carves "segments" out of
+/// background noise; the always-listening path can check this before spending
+/// an ASR call on one. Not yet measured on real mic audio, so that check is
+/// opt-in (`listen_energy_gate`).
+pub const MIN_SPEECH_RMS: f32 = 0.005;
+
 /// Incremental front-end to [`segment_speech`] for the streaming-cleanup path.
 /// Audio is pushed in as it's captured; [`Self::take_complete`] returns the
 /// sample ranges of sentence-segments that are *confirmed finished* (a pause of
@@ -118,6 +143,11 @@ impl SegmentStream {
         &self.buf
     }
 
+    /// Consume the stream, returning the captured audio without copying it.
+    pub fn into_buf(self) -> Vec<f32> {
+        self.buf
+    }
+
     fn min_pause_samples(&self) -> usize {
         (self.cfg.min_pause_ms / 1000.0 * self.sr as f32) as usize
     }
@@ -308,6 +338,17 @@ mod tests {
         assert_eq!(fin.len(), 1, "tail flushes after compact: {fin:?}");
     }
 
+    #[test]
+    fn rms_separates_room_tone_from_speech() {
+        assert_eq!(rms(&[]), 0.0);
+        let mut a = Vec::new();
+        tone(&mut a, 0.1, 0.5);
+        assert!((rms(&a) - 0.5).abs() < 1e-6);
+        let mut hum = Vec::new();
+        tone(&mut hum, 0.1, 0.001);
+        assert!(rms(&hum) < MIN_SPEECH_RMS && rms(&a) > MIN_SPEECH_RMS);
+    }
+
     #[test]
     fn segments_are_ordered_and_in_bounds() {
         let mut a = Vec::new();
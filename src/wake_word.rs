@@ -38,42 +38,58 @@ const LEAD_INS: &[&str] = &["hey", "ok", "okay", "yo", "hi", "hello"];
 /// Lowercased alphanumeric tokens of `s`, each with its byte range in the
 /// original string. Punctuation and whitespace are separators and are dropped;
 /// the ranges let us recover the original (cased, punctuated) tail after a match.
-fn tokenize(s: &str) -> Vec<(String, std::ops::Range<usize>)> {
-    let mut out = Vec::new();
-    let mut start: Option<usize> = None;
-    for (i, ch) in s.char_indices() {
-        if ch.is_alphanumeric() {
-            if start.is_none() {
-                start = Some(i);
+/// Lazy, so a caller that only looks at the first few tokens stops scanning (and
+/// lowercasing) there.
+fn tokens(s: &str) -> impl Iterator<Item = (String, std::ops::Range<usize>)> + '_ {
+    let mut rest = s.char_indices().peekable();
+    std::iter::from_fn(move || {
+        let (st, _) = rest.find(|&(_, ch)| ch.is_alphanumeric())?;
+        let mut end = s.len();
+        while let Some(&(i, ch)) = rest.peek() {
+            if !ch.is_alphanumeric() {
+                end = i;
+                break;
             }
-        } else if let Some(st) = start.take() {
-            out.push((s[st..i].to_lowercase(), st..i));
+            rest.next();
         }
-    }
-    if let Some(st) = start {
-        out.push((s[st..].to_lowercase(), st..s.len()));
-    }
-    out
+        Some((s[st..end].to_lowercase(), st..end))
+    })
 }
 
-/// Levenshtein distance, capped early at 2 (we only ever care about ≤1).
-fn edit_distance(a: &str, b: &str) -> usize {
-    let a: Vec<char> = a.chars().collect();
-    let b: Vec<char> = b.chars().collect();
-    if a.len().abs_diff(b.len()) > 1 {
-        return 2;
-    }
-    let mut prev: Vec<usize> = (0..=b.len()).collect();
-    let mut cur = vec![0usize; b.len() + 1];
-    for (i, &ca) in a.iter().enumerate() {
-        cur[0] = i + 1;
-        for (j, &cb) in b.iter().enumerate() {
-            let cost = if ca == cb { 0 } else { 1 };
-            cur[j + 1] = (prev[j] + cost).min(prev[j + 1] + 1).min(cur[j] + 1);
+/// True when `a` and `b` are within one edit (substitution, insertion or
+/// deletion) of each other. Matching only ever asks "≤ 1?", so this walks both
+/// strings once, char by char, and bails at the second difference instead of
+/// filling a Levenshtein table (and collecting both into `Vec<char>`s first).
+fn within_one_edit(a: &str, b: &str) -> bool {
+    let (la, lb) = (a.chars().count(), b.chars().count());
+    if la.abs_diff(lb) > 1 {
+        return false;
+    }
+    // Let `long` be the longer (or equal) string; a length gap means the one
+    // allowed edit is a skip in `long`, otherwise it's a substitution.
+    let (long, short) = if la >= lb { (a, b) } else { (b, a) };
+    let skip_on_mismatch = la != lb;
+    let (mut l, mut sh) = (long.chars(), short.chars());
+    let mut edited = false;
+    loop {
+        match (l.next(), sh.next()) {
+            (Some(x), Some(y)) if x == y => {}
+            (Some(_), None) | (None, None) => return true,
+            (None, Some(_)) => unreachable!("`long` has at least as many chars as `short`"),
+            (Some(_), Some(y)) => {
+                if edited {
+                    return false;
+                }
+                edited = true;
+                if skip_on_mismatch {
+                    // Drop the extra char from `long`; `y` must match its next one.
+                    if l.next() != Some(y) {
+                        return false;
+                    }
+                }
+            }
         }
-        std::mem::swap(&mut prev, &mut cur);
     }
-    prev[b.len()]
 }
 
 /// Fuzzy token equality: exact for short tokens, one-edit slack for tokens of
@@ -82,50 +98,73 @@ fn token_matches(spoken: &str, want: &str) -> bool {
     if spoken == want {
         return true;
     }
-    want.len() >= 4 && edit_distance(spoken, want) <= 1
+    want.len() >= 4 && within_one_edit(spoken, want)
 }
 
-/// Detect a leading wake word in `transcript`. Returns the dictation body
-/// (text after the wake word) when the segment opens with the wake word
-/// (optionally after a polite lead-in); `None` otherwise. `wake_word` may be
-/// multiple words ("hey jarvis"); blank/whitespace wake words never match.
-pub fn detect(transcript: &str, wake_word: &str) -> Option<WakeMatch> {
-    let want: Vec<String> = tokenize(wake_word).into_iter().map(|(t, _)| t).collect();
-    if want.is_empty() {
-        return None;
-    }
-    let spoken = tokenize(transcript);
-    if spoken.is_empty() {
-        return None;
-    }
+/// A wake phrase tokenized once. The listen loop checks every heard segment
+/// against the same phrase, so it builds this at startup and calls
+/// [`Self::detect`] per segment instead of re-tokenizing (and re-lowercasing)
+/// the wake word on each one.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct WakeWord {
+    tokens: Vec<String>,
+}
 
-    // Try matching the wake phrase at token 0, or after a single lead-in token
-    // when that lead-in isn't itself the first word of the wake phrase.
-    let mut starts = vec![0usize];
-    if spoken.len() > 1 && LEAD_INS.contains(&spoken[0].0.as_str()) && spoken[0].0 != want[0] {
-        starts.push(1);
+impl WakeWord {
+    pub fn new(wake_word: &str) -> Self {
+        Self { tokens: tokens(wake_word).map(|(t, _)| t).collect() }
     }
 
-    for &start in &starts {
-        if start + want.len() > spoken.len() {
-            continue;
+    /// Detect a leading wake word in `transcript`. Returns the dictation body
+    /// (text after the wake word) when the segment opens with the wake word
+    /// (optionally after a polite lead-in); `None` otherwise. A blank wake
+    /// word never matches.
+    pub fn detect(&self, transcript: &str) -> Option<WakeMatch> {
+        let want = &self.tokens;
+        if want.is_empty() {
+            return None;
+        }
+        // The phrase can start no later than token 1 (after a lead-in), so no
+        // token past `want.len() + 1` can affect the decision.
+        let spoken: Vec<_> = tokens(transcript).take(want.len() + 1).collect();
+        if spoken.is_empty() {
+            return None;
+        }
+
+        // Try matching the wake phrase at token 0, or after a single lead-in token
+        // when that lead-in isn't itself the first word of the wake phrase.
+        let mut starts = vec![0usize];
+        if spoken.len() > 1 && LEAD_INS.contains(&spoken[0].0.as_str()) && spoken[0].0 != want[0] {
+            starts.push(1);
         }
-        let matched = want
-            .iter()
-            .enumerate()
-            .all(|(k, w)| token_matches(&spoken[start + k].0, w));
-        if !matched {
-            continue;
+
+        for &start in &starts {
+            if start + want.len() > spoken.len() {
+                continue;
+            }
+            let matched = want
+                .iter()
+                .enumerate()
+                .all(|(k, w)| token_matches(&spoken[start + k].0, w));
+            if !matched {
+                continue;
+            }
+            // Body = original text after the last matched token, with leading
+            // punctuation/space stripped. Preserves the body's casing untouched.
+            let end = spoken[start + want.len() - 1].1.end;
+            let body = transcript[end..]
+                .trim_start_matches(|c: char| !c.is_alphanumeric())
+                .to_string();
+            return Some(WakeMatch { body });
         }
-        // Body = original text after the last matched token, with leading
-        // punctuation/space stripped. Preserves the body's casing untouched.
-        let end = spoken[start + want.len() - 1].1.end;
-        let body = transcript[end..]
-            .trim_start_matches(|c: char| !c.is_alphanumeric())
-            .to_string();
-        return Some(WakeMatch { body });
-    }
-    None
+        None
+    }
+}
+
+/// One-shot form of [`WakeWord::detect`]. `wake_word` may be multiple words
+/// ("hey jarvis"); blank/whitespace wake words never match.
+pub fn detect(transcript: &str, wake_word: &str) -> Option<WakeMatch> {
+    WakeWord::new(wake_word).detect(transcript)
 }
 
 #[cfg(test)]
@@ -198,6 +237,55 @@ mod tests {
         assert_eq!(body("abe do it", "abe").as_deref(), Some("do it"));
     }
 
+    #[test]
+    fn prebuilt_wake_word_is_reusable_across_segments() {
+        let w = WakeWord::new("Hey Jarvis");
+        let cases = [
+            ("hey jarvis turn on the lights", Some("turn on the lights")),
+            ("Hey Jarvis.", Some("")),
+            ("ok hey jarvis x", Some("x")),
+            ("jarvis go", None),
+            ("hello there jarvis go", None),
+        ];
+        for (t, want) in cases {
+            assert_eq!(w.detect(t).map(|m| m.body).as_deref(), want, "{t:?}");
+        }
+        assert_eq!(WakeWord::new("  ").detect("hey jarvis go"), None);
+    }
+
+    #[test]
+    fn within_one_edit_matches_levenshtein_le_1() {
+        let cases = [
+            ("computer", "computer", true),
+            ("computers", "computer", true),
+            ("compter", "computer", true),
+            ("komputer", "computer", true),
+            ("comptuer", "computer", false), // transposition = 2 edits
+            ("computes", "computer", true),
+            ("compute", "computers", false),
+            ("xcomputer", "computer", true),
+            ("café", "cafe", true),
+            ("", "a", true),
+            ("", "ab", false),
+        ];
+        for (a, b, want) in cases {
+            assert_eq!(within_one_edit(a, b), want, "{a:?} vs {b:?}");
+            assert_eq!(within_one_edit(b, a), want, "{b:?} vs {a:?}");
+        }
+    }
+
+    #[test]
+    fn tokens_split_on_punctuation_and_keep_byte_ranges() {
+        let t = "  Hey, Jarvis!  ça-va 42";
+        let got: Vec<_> = tokens(t).collect();
+        let words: Vec<_> = got.iter().map(|(w, _)| w.as_str()).collect();
+        assert_eq!(words, ["hey", "jarvis", "ça", "va", "42"]);
+        for (w, r) in &got {
+            assert_eq!(&t[r.clone()].to_lowercase(), w);
+        }
+        assert_eq!(tokens(" ,. ").count(), 0);
+    }
+
     #[test]
     fn empty_transcript() {
         assert_eq!(body("", "computer"), None);